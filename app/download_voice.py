@@ -0,0 +1,104 @@
+import functools
+import http.client
+import os
+import pathlib
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from piper import download as piper_download
+
+from app.initialize_voice_engine import get_writable_directory
+from app.logger import logger
+
+DOWNLOAD_CONNECTIONS = 8
+DOWNLOAD_TIMEOUT = 60
+
+
+def download_in_ranges(url: str, target: pathlib.Path, size: int, parts: int = DOWNLOAD_CONNECTIONS) -> None:
+    """Download a file of known size over several connections using HTTP range requests."""
+    part_size = max(-(-size // parts), 1)
+
+    with target.open("wb") as target_file:
+        target_file.truncate(size)
+        fd = target_file.fileno()
+
+        def fetch_range(start: int) -> None:
+            end = min(start + part_size, size)
+            request = urllib.request.Request(url, headers={"Range": f"bytes={start}-{end - 1}"})
+            with urllib.request.urlopen(request, timeout=DOWNLOAD_TIMEOUT) as response:
+                if response.status != 206:
+                    raise OSError(f"Server did not honour range request for {url}")
+                offset = start
+                while chunk := response.read(1 << 20):
+                    os.pwrite(fd, chunk, offset)
+                    offset += len(chunk)
+            if offset != end:
+                raise OSError(f"Incomplete range {start}-{end - 1} for {url}")
+
+        with ThreadPoolExecutor(max_workers=parts) as executor:
+            # Consume the results so exceptions from any range propagate
+            list(executor.map(fetch_range, range(0, size, part_size)))
+
+
+def prefetch_model_weights(model: str, voices_info: dict[str, Any], download_dir: pathlib.Path) -> None:
+    """Fetch the voice's .onnx weights in parallel ahead of piper's single-connection download.
+
+    piper verifies existing files by size and checksum and only downloads what is missing or wrong, so a
+    failed prefetch simply falls back to its own download.
+    """
+    voice_info = voices_info.get(model)
+    if voice_info is None:
+        return
+
+    for file_path, file_info in voice_info.get("files", {}).items():
+        if not file_path.endswith(".onnx"):
+            continue
+        target = download_dir / pathlib.Path(file_path).name
+        size = int(file_info["size_bytes"])
+        if target.exists() and target.stat().st_size == size:
+            continue
+        url = piper_download.URL_FORMAT.format(file=urllib.parse.quote(file_path))
+        logger.info("Downloading %s (%d bytes) over %d connections.", file_path, size, DOWNLOAD_CONNECTIONS)
+        try:
+            download_in_ranges(url, target, size)
+        # A truncated range body raises http.client.IncompleteRead, which is not an OSError
+        except (OSError, http.client.HTTPException):
+            logger.warning("Parallel download of %s failed; falling back to piper.", file_path, exc_info=True)
+            target.unlink(missing_ok=True)
+
+
+@functools.lru_cache(maxsize=4)
+def get_voices_info(download_dir: pathlib.Path) -> dict[str, Any]:
+    """Load piper's voice catalogue with aliases resolved, once per download directory; treat it as read-only."""
+    # Load voice information
+    voices_info: dict[str, Any] = piper_download.get_voices(download_dir, update_voices=False)
+    logger.info("Available voices info retrieved. Total voices available: %d", len(voices_info))
+
+    # Resolve aliases for backwards compatibility
+    aliases_info: dict[str, Any] = {}
+    for voice_name, voice_info in voices_info.items():
+        for voice_alias in voice_info.get("aliases", []):
+            aliases_info[voice_alias] = {"_is_alias": True, **voice_info}
+            logger.debug("Alias '%s' resolved for voice '%s'.", voice_alias, voice_name)
+
+    voices_info.update(aliases_info)
+    logger.info("Aliases resolved.")
+    return voices_info
+
+
+def download_voice_model(model: str) -> tuple[pathlib.Path, pathlib.Path]:
+    """Download the voice model and its config, returning their paths."""
+    download_dir = get_writable_directory()
+    data_dir = [download_dir]
+
+    voices_info = get_voices_info(download_dir)
+    logger.info("Checking if model %s exists in voices info.", model)
+
+    # Download and verify the specified model; piper raises if it cannot be found afterwards
+    prefetch_model_weights(model, voices_info, download_dir)
+    piper_download.ensure_voice_exists(model, data_dir, download_dir, voices_info)
+    model_path, model_config_path = piper_download.find_voice(model, data_dir)
+    logger.info("Model %s downloaded and located successfully.", model)
+    return model_path, model_config_path
@@ -1,17 +1,42 @@
+import functools
+import json
 import os
 import pathlib
-from typing import Any
+import tempfile
 
+import onnxruntime
 import piper
-from piper import download as piper_download
+from piper.config import PiperConfig
 
 from app.logger import logger
 
 
+@functools.lru_cache(maxsize=1)
+def get_assets_directory() -> pathlib.Path:
+    """Return the configured assets directory, resolved once per process."""
+    return pathlib.Path(os.getenv("ASSETS_DIR", "/app/assets"))
+
+
+@functools.lru_cache(maxsize=4)
+def is_writable_directory(directory: pathlib.Path) -> bool:
+    """Probe whether files can be created in a directory; the result is cached for the lifetime of the process.
+
+    Writability is probed by creating a temporary file, since os.access can misreport permissions on overlay
+    filesystems and with ACLs.
+    """
+    try:
+        with tempfile.NamedTemporaryFile(dir=directory):
+            pass
+    except OSError:
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=1)
 def get_writable_directory() -> pathlib.Path:
-    """Determine a writable directory for storing model data."""
-    assets_dir = pathlib.Path(os.getenv("ASSETS_DIR", "/app/assets"))
-    if os.access(assets_dir, os.W_OK):
+    """Determine a writable directory for storing model data, falling back to the home directory."""
+    assets_dir = get_assets_directory()
+    if is_writable_directory(assets_dir):
         logger.info("Using writable application directory: %s", assets_dir)
         return assets_dir
     home_directory = pathlib.Path.home()
@@ -23,35 +48,99 @@ def get_writable_directory() -> pathlib.Path:
 
 def initialize_voice_engine(model: str) -> piper.PiperVoice:
     """Initialize the voice engine, downloading the model if necessary."""
-    assets_dir = pathlib.Path(os.getenv("ASSETS_DIR", "/app/assets"))
+    assets_dir = get_assets_directory()
     model_path = assets_dir / model
     model_config_path = assets_dir / f"{model}.json"
 
-    if not model_path.exists() and not model_config_path.exists():
-        download_dir = get_writable_directory()
-        data_dir = [download_dir]
+    # Either file missing triggers a download. Other errors propagate, including NotADirectoryError for an assets
+    # path that is not a directory, which Path.exists() used to report as a missing model.
+    try:
+        model_path.stat()
+        model_config_path.stat()
+    except FileNotFoundError:
         logger.info("Model %s not found locally. Attempting to download.", model)
+        # Imported lazily: the download machinery is only needed when the model is not already on disk
+        from app import download_voice
 
-        # Load voice information
-        voices_info = piper_download.get_voices(download_dir, update_voices=False)
-        logger.info("Available voices info retrieved. Total voices available: %d", len(voices_info))
-
-        # Resolve aliases for backwards compatibility
-        aliases_info: dict[str, Any] = {}
-        for voice_name, voice_info in voices_info.items():
-            for voice_alias in voice_info.get("aliases", []):
-                aliases_info[voice_alias] = {"_is_alias": True, **voice_info}
-                logger.debug("Alias '%s' resolved for voice '%s'.", voice_alias, voice_name)
-
-        voices_info.update(aliases_info)
-        logger.info("Aliases resolved. Checking if model %s exists in voices info.", model)
-
-        # Download and verify the specified model
-        piper_download.ensure_voice_exists(model, data_dir, download_dir, voices_info)
-        model_path, model_config_path = piper_download.find_voice(model, data_dir)
-        logger.info("Model %s downloaded and located successfully.", model)
+        model_path, model_config_path = download_voice.download_voice_model(model)
     else:
         logger.info("Model %s found locally at %s.", model, model_path)
 
     logger.info("Loading Piper voice model from %s with config.", model)
-    return piper.PiperVoice.load(model_path, config_path=model_config_path)
+    with model_config_path.open(encoding="utf-8") as config_file:
+        config = PiperConfig.from_dict(json.load(config_file))
+    return piper.PiperVoice(config=config, session=create_inference_session(model_path))
+
+
+@functools.lru_cache(maxsize=1)
+def get_optimized_model_directory() -> pathlib.Path:
+    """Return the directory for optimized model graphs; ORT_CACHE_DIR overrides the writable model directory."""
+    cache_dir = os.getenv("ORT_CACHE_DIR")
+    return pathlib.Path(cache_dir) if cache_dir else get_writable_directory()
+
+
+def create_inference_session(model_path: pathlib.Path) -> onnxruntime.InferenceSession:
+    """Create an ONNX Runtime session, reusing a previously optimized graph when one was saved.
+
+    Graph optimization dominates model load time, so the first start stores the optimized graph in a writable
+    directory. Only hardware-independent optimizations are persisted; layout optimizations specific to the
+    current CPU are applied when the saved graph is loaded. Without a writable directory the model is optimized
+    in memory only.
+    """
+    cache_dir = get_optimized_model_directory()
+    if not is_writable_directory(cache_dir):
+        logger.info("No writable directory for the optimized model graph; optimizing %s in memory.", model_path)
+        return create_plain_inference_session(model_path)
+
+    # Size and mtime of the source model are part of the name, so a replaced model never loads a stale graph
+    model_stat = model_path.stat()
+    optimized_model_path = cache_dir / (
+        f"{model_path.stem}.{model_stat.st_size}-{model_stat.st_mtime_ns}.ort-{onnxruntime.__version__}.opt.onnx"
+    )
+
+    if not optimized_model_path.exists():
+        try:
+            save_optimized_model(model_path, optimized_model_path)
+        except Exception:
+            logger.warning(
+                "Could not save optimized model %s; loading without it.", optimized_model_path, exc_info=True
+            )
+            optimized_model_path.unlink(missing_ok=True)
+            return create_plain_inference_session(model_path)
+        logger.info("Saved optimized model graph to %s.", optimized_model_path)
+
+    try:
+        session = create_plain_inference_session(optimized_model_path)
+    except Exception:
+        # Removing the unusable graph lets the next start rebuild it
+        logger.warning("Could not load optimized model %s; loading without it.", optimized_model_path, exc_info=True)
+        optimized_model_path.unlink(missing_ok=True)
+        return create_plain_inference_session(model_path)
+    logger.info("Loaded optimized model graph from %s.", optimized_model_path)
+    return session
+
+
+def save_optimized_model(model_path: pathlib.Path, optimized_model_path: pathlib.Path) -> None:
+    """Persist the hardware-independent optimizations of a model using a throwaway session."""
+    sess_options = onnxruntime.SessionOptions()
+    sess_options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+    sess_options.optimized_model_filepath = str(optimized_model_path)
+    onnxruntime.InferenceSession(str(model_path), sess_options=sess_options, providers=["CPUExecutionProvider"])
+
+
+def create_plain_inference_session(model_path: pathlib.Path) -> onnxruntime.InferenceSession:
+    """Create an ONNX Runtime session with all optimizations applied in memory, without persisting anything."""
+    sess_options = onnxruntime.SessionOptions()
+    sess_options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    return onnxruntime.InferenceSession(str(model_path), sess_options=sess_options, providers=["CPUExecutionProvider"])
+
+
+def warm_up_voice_engine(voice_engine: piper.PiperVoice) -> None:
+    """Run a short synthesis so ONNX Runtime allocations happen at startup rather than on the first request."""
+    try:
+        for _ in voice_engine.synthesize_stream_raw("Warm up."):
+            pass
+    except Exception:
+        logger.warning("Voice engine warm-up failed; the first request will pay the setup cost.", exc_info=True)
+    else:
+        logger.info("Voice engine warmed up.")
@@ -10,4 +10,9 @@ logging.basicConfig(
     stream=sys.stdout,
 )
 
+# The log format uses none of these, so skip collecting them for every record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 logger = logging.getLogger("TTS Batch API")
@@ -1,82 +1,483 @@
+import asyncio
+import base64
 import hashlib
+import hmac
 import logging
 import os
+import random
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Coroutine, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Annotated
+from typing import Annotated, Any
 
 import piper
 from fastapi import FastAPI, Header, HTTPException, responses
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
 from redis import asyncio as aioredis
+from redis.exceptions import RedisError
 
 from app import initialize_voice_engine as init_voice
+from app.logger import logger
+
+# First byte of every value stored in Redis, identifying how the rest is encoded
+CACHE_FORMAT_ZLIB = b"\x01"
 
 
 @dataclass
 class CacheConfig:
     enabled: bool = True
     ttl: int = 60 * 60 * 24 * 7  # 7 days in seconds
+    ttl_jitter: float = 0.1  # fraction of the TTL randomly added or removed per entry
+    compression_level: int = 3  # zlib level, 1 (fastest) to 9 (smallest)
+    local_max: int = 128  # entries kept in the in-process LRU, 0 disables it
+    local_ttl: int = 60  # seconds an in-process entry is served before Redis is consulted again
+    pool_size: int = 16  # Redis connections per worker process
+    pool_timeout: int = 2  # seconds to wait for a free pooled connection before failing
+    breaker_threshold: int = 3  # consecutive Redis errors before the cache is bypassed
+    breaker_cooldown: int = 30  # seconds the cache is bypassed before Redis is tried again
+
+
+def jittered_ttl(ttl: int, jitter: float) -> int:
+    """Randomly spread a TTL by up to the given fraction in either direction.
+
+    Entries cached or refreshed together then do not all expire, and get resynthesized, at the same moment.
+    """
+    max_jitter = int(ttl * jitter)
+    return ttl + random.randint(-max_jitter, max_jitter)
+
+
+class RedisBatcher:
+    """Coalesce concurrent Redis commands into pipelines to save round trips.
+
+    Reads issued during one event loop iteration share a pipeline. Writes are collected for a short window, or
+    until a batch is full, since they come from background tasks that are not latency sensitive.
+    """
+
+    def __init__(
+        self,
+        redis: aioredis.Redis,
+        ttl: int,
+        ttl_jitter: float = 0.0,
+        write_delay: float = 0.005,
+        max_writes: int = 32,
+    ) -> None:
+        self.redis = redis
+        self.ttl = ttl
+        self.ttl_jitter = ttl_jitter
+        self.write_delay = write_delay
+        self.max_writes = max_writes
+        self._pending_reads: dict[str, asyncio.Future[bytes | None]] = {}
+        self._pending_writes: list[tuple[str, int, bytes, asyncio.Future[None]]] = []
+        self._write_flush_handle: asyncio.TimerHandle | None = None
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+
+    async def get(self, key: str) -> bytes | None:
+        """Get a value and refresh its TTL, batched with other reads from the same loop iteration."""
+        future = self._pending_reads.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if not self._pending_reads:
+                loop.call_soon(self._schedule_read_flush)
+            future = loop.create_future()
+            self._pending_reads[key] = future
+        # Identical keys share one future; shield it so a cancelled caller does not cancel the others.
+        return await asyncio.shield(future)
+
+    async def setex(self, key: str, ttl: int, value: bytes) -> None:
+        """Set a value with a TTL, batched with other writes from the next few milliseconds."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        self._pending_writes.append((key, ttl, value, future))
+        if len(self._pending_writes) >= self.max_writes:
+            self._schedule_write_flush()
+        elif self._write_flush_handle is None:
+            self._write_flush_handle = loop.call_later(self.write_delay, self._schedule_write_flush)
+        await future
+
+    def _schedule_read_flush(self) -> None:
+        pending, self._pending_reads = self._pending_reads, {}
+        self._start_flush(self._flush_reads(pending))
+
+    def _schedule_write_flush(self) -> None:
+        if self._write_flush_handle is not None:
+            self._write_flush_handle.cancel()
+            self._write_flush_handle = None
+        pending, self._pending_writes = self._pending_writes, []
+        self._start_flush(self._flush_writes(pending))
+
+    def _start_flush(self, flush: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(flush)
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush_reads(self, pending: dict[str, asyncio.Future[bytes | None]]) -> None:
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key in pending:
+                    pipe.get(key).expire(key, jittered_ttl(self.ttl, self.ttl_jitter))  # type: ignore
+                results = await pipe.execute()
+        except Exception as exc:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        # Each key queued a GET followed by an EXPIRE; only the GET replies are of interest.
+        for future, value in zip(pending.values(), results[::2], strict=True):
+            if not future.done():
+                future.set_result(value)
+
+    async def _flush_writes(self, pending: list[tuple[str, int, bytes, asyncio.Future[None]]]) -> None:
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, ttl, value, _ in pending:
+                    pipe.setex(key, ttl, value)
+                await pipe.execute()
+        except Exception as exc:
+            for *_, future in pending:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for *_, future in pending:
+            if not future.done():
+                future.set_result(None)
 
 
 class TTSCache:
     def __init__(self, redis_url: str, config: CacheConfig) -> None:
-        self.redis = aioredis.from_url(redis_url)
+        # A blocking pool makes bursts wait briefly for a free connection instead of failing outright
+        connection_pool: aioredis.BlockingConnectionPool = aioredis.BlockingConnectionPool.from_url(
+            redis_url,
+            max_connections=config.pool_size,
+            timeout=config.pool_timeout,
+            socket_connect_timeout=5,
+            socket_timeout=5,
+            socket_keepalive=True,
+            health_check_interval=30,
+        )
+        self.redis = aioredis.Redis(connection_pool=connection_pool)
         self.config = config
+        self.batcher = RedisBatcher(self.redis, config.ttl, config.ttl_jitter)
         self.logger = logging.getLogger("tts_cache")
+        self._voice_hashers: dict[str, hashlib.blake2b] = {}
+        self._consecutive_failures = 0
+        self._bypass_until = 0.0
+        self._last_error: RedisError | None = None
+        # Small in-process LRU in front of Redis so hot phrases skip the network round trip.
+        # Entries are (monotonic expiry time, audio data).
+        self._local_cache: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
 
     def _generate_cache_key(self, text: str, voice_id: str = "default") -> str:
-        """Generate a deterministic cache key for the TTS request."""
-        key_content = f"{voice_id}:{text}"
-        return f"tts:{hashlib.sha256(key_content.encode()).hexdigest()}"
+        """Generate a deterministic cache key for the TTS request.
+
+        The digest only namespaces cache entries, so a 128-bit BLAKE2b digest is used: it is faster than SHA256
+        on CPUs without SHA extensions and keeps the key stored in Redis short.
+        """
+        voice_hasher = self._voice_hashers.get(voice_id)
+        if voice_hasher is None:
+            # Hash the "voice_id:" prefix once per voice and clone its state for every request.
+            voice_hasher = hashlib.blake2b(digest_size=16)
+            voice_hasher.update(voice_id.encode() + b":")
+            self._voice_hashers[voice_id] = voice_hasher
+        hasher = voice_hasher.copy()
+        hasher.update(text.encode())
+        # URL-safe base64 without padding keeps the key at 22 characters instead of 32 hex digits
+        return f"tts:{base64.urlsafe_b64encode(hasher.digest()).rstrip(b'=').decode()}"
 
     async def get(self, text: str, voice_id: str = "default") -> bytes | None:
         """Retrieve cached audio data if available."""
         if not self.config.enabled:
-            self.logger.info("Cache disabled, skipping lookup")
+            self.logger.debug("Cache disabled, skipping lookup")
             return None
 
         cache_key = self._generate_cache_key(text, voice_id)
-        cached_data: bytes = await self.redis.get(cache_key)  # type: ignore
+        local_data = self._get_local(cache_key)
+        if local_data is not None:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Local cache HIT for text: %s (key: %s)", text[:50], cache_key)
+            return local_data
+
+        if self._bypassed():
+            return None
+        try:
+            # The batcher refreshes the TTL in the same round trip so frequently requested phrases stay cached.
+            stored_data = await self.batcher.get(cache_key)
+        except RedisError as exc:
+            self._record_failure(exc)
+            return None
+        self._consecutive_failures = 0
+        cached_data = self._decode(cache_key, stored_data) if stored_data else None
 
         if cached_data:
-            self.logger.info("Cache HIT for text: %s (key: %s)", text[:50], cache_key)
-        else:
-            self.logger.info("Cache MISS for text: %s (key: %s)", text[:50], cache_key)
+            self._store_local(cache_key, cached_data)
+        # Skip slicing the text for log arguments when the record would be dropped anyway.
+        if self.logger.isEnabledFor(logging.DEBUG):
+            if cached_data:
+                self.logger.debug("Cache HIT for text: %s (key: %s)", text[:50], cache_key)
+            else:
+                self.logger.debug("Cache MISS for text: %s (key: %s)", text[:50], cache_key)
 
         return cached_data
 
     async def set(self, text: str, audio_data: bytes, voice_id: str = "default") -> None:
         """Store audio data in cache."""
         if not self.config.enabled:
-            self.logger.info("Cache disabled, skipping storage")
+            self.logger.debug("Cache disabled, skipping storage")
             return
 
         cache_key = self._generate_cache_key(text, voice_id)
-        await self.redis.setex(cache_key, self.config.ttl, audio_data)
-        self.logger.info(
-            "Cached %d bytes for text: %s (key: %s, TTL: %d)", len(audio_data), text[:50], cache_key, self.config.ttl
-        )
+        self._store_local(cache_key, audio_data)
+        if self._bypassed():
+            return
+
+        # Compression of a full utterance takes long enough to be worth keeping off the event loop.
+        compressed_data = await asyncio.to_thread(zlib.compress, audio_data, self.config.compression_level)
+        stored_data = CACHE_FORMAT_ZLIB + compressed_data
+        ttl = jittered_ttl(self.config.ttl, self.config.ttl_jitter)
+        try:
+            await self.batcher.setex(cache_key, ttl, stored_data)
+        except RedisError as exc:
+            self._record_failure(exc)
+            return
+        self._consecutive_failures = 0
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Cached %d bytes (%d stored) for text: %s (key: %s, TTL: %d)",
+                len(audio_data),
+                len(stored_data),
+                text[:50],
+                cache_key,
+                ttl,
+            )
+
+    def _bypassed(self) -> bool:
+        """Whether Redis is skipped after repeated errors, so requests do not each wait out a timeout."""
+        return self._bypass_until > time.monotonic()
+
+    def _record_failure(self, error: RedisError) -> None:
+        # Every caller sharing a failed pipeline receives the same exception; count that round trip once
+        if error is self._last_error:
+            return
+        self._last_error = error
+        self._consecutive_failures += 1
+        self.logger.warning("Redis cache operation failed (%d in a row)", self._consecutive_failures, exc_info=True)
+        if self._consecutive_failures >= self.config.breaker_threshold:
+            self._bypass_until = time.monotonic() + self.config.breaker_cooldown
+            self._consecutive_failures = 0
+            self.logger.warning("Bypassing Redis cache for %d seconds", self.config.breaker_cooldown)
+
+    def _decode(self, cache_key: str, stored_data: bytes) -> bytes | None:
+        """Decode a stored entry by its format byte; unknown or corrupt entries are treated as misses."""
+        if stored_data[:1] == CACHE_FORMAT_ZLIB:
+            try:
+                return zlib.decompress(stored_data[1:])
+            except zlib.error:
+                pass
+        self.logger.warning("Discarding undecodable cache entry (key: %s)", cache_key)
+        return None
+
+    def _get_local(self, cache_key: str) -> bytes | None:
+        """Look up unexpired audio data in the in-process LRU, marking it as recently used."""
+        entry = self._local_cache.get(cache_key)
+        if entry is None:
+            return None
+        expires_at, audio_data = entry
+        if expires_at <= time.monotonic():
+            del self._local_cache[cache_key]
+            return None
+        self._local_cache.move_to_end(cache_key)
+        return audio_data
+
+    def _store_local(self, cache_key: str, audio_data: bytes) -> None:
+        """Insert audio data into the in-process LRU, evicting the least recently used entry when full."""
+        self._local_cache[cache_key] = (time.monotonic() + self.config.local_ttl, audio_data)
+        self._local_cache.move_to_end(cache_key)
+        if len(self._local_cache) > self.config.local_max:
+            self._local_cache.popitem(last=False)
+
+    async def connect(self) -> None:
+        """Open a pooled connection ahead of the first request; failures are logged, not raised."""
+        if not self.config.enabled:
+            return
+        try:
+            await self.redis.ping()
+        except RedisError:
+            self.logger.warning("Redis is not reachable yet; connecting on first use", exc_info=True)
 
     async def close(self) -> None:
         """Close Redis connection."""
-        await self.redis.close()
+        # The client does not own a pool passed in explicitly, so it has to be closed along with it
+        await self.redis.aclose(close_connection_pool=True)  # type: ignore[attr-defined]
 
 
 class SynthesizeRequest(BaseModel):
     text: str
 
 
+class SynthesisJob:
+    """Audio for one text as it is being synthesized, shared by every request for that text meanwhile."""
+
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+        self.finished = False
+        self.error: Exception | None = None
+        self._changed = asyncio.Condition()
+
+    async def publish(self, chunk: bytes) -> None:
+        async with self._changed:
+            self.chunks.append(chunk)
+            self._changed.notify_all()
+
+    async def finish(self, error: Exception | None = None) -> None:
+        async with self._changed:
+            self.finished = True
+            self.error = error
+            self._changed.notify_all()
+
+    async def started(self) -> None:
+        """Wait until the first chunk is available, raising the error if synthesis failed before producing any."""
+        async with self._changed:
+            await self._changed.wait_for(lambda: bool(self.chunks) or self.finished)
+        if not self.chunks and self.error:
+            raise self.error
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        """Yield all chunks from the beginning, waiting for new ones until synthesis finishes."""
+        sent = 0
+        while True:
+            async with self._changed:
+                while not self.finished and len(self.chunks) == sent:
+                    await self._changed.wait()
+                new_chunks = self.chunks[sent:]
+            if not new_chunks and self.finished:
+                if self.error:
+                    raise self.error
+                return
+            for chunk in new_chunks:
+                yield chunk
+            sent += len(new_chunks)
+
+
 ml_models: dict[str, piper.PiperVoice] = {}
 cache: TTSCache | None = None
+allowed_user_token: bytes | None = None
+synthesis_executor: ThreadPoolExecutor | None = None
+# Syntheses in progress by text, so concurrent misses for the same text run Piper only once
+inflight_syntheses: dict[str, SynthesisJob] = {}
+# Texts whose synthesis failed recently, mapped to the monotonic time after which they may be retried
+failed_syntheses: OrderedDict[str, float] = OrderedDict()
+FAILED_SYNTHESIS_RETRY_AFTER = 30  # seconds
+FAILED_SYNTHESIS_MAX_ENTRIES = 1024
+# Strong references to fire-and-forget tasks so they are not garbage collected before finishing
+background_tasks: set[asyncio.Task[None]] = set()
+
+
+def remember_failed_synthesis(text: str) -> None:
+    """Reject the text for a short while so repeated requests fail fast instead of rerunning Piper."""
+    failed_syntheses[text] = time.monotonic() + FAILED_SYNTHESIS_RETRY_AFTER
+    failed_syntheses.move_to_end(text)
+    if len(failed_syntheses) > FAILED_SYNTHESIS_MAX_ENTRIES:
+        failed_syntheses.popitem(last=False)
+
+
+def synthesis_failed_recently(text: str) -> bool:
+    """Whether the text failed within the retry window; expired entries are dropped."""
+    retry_at = failed_syntheses.get(text)
+    if retry_at is None:
+        return False
+    if retry_at > time.monotonic():
+        return True
+    del failed_syntheses[text]
+    return False
+
+
+def run_in_background(coro: Coroutine[Any, Any, None]) -> None:
+    """Schedule a coroutine without awaiting it; pending tasks are drained on shutdown."""
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(_background_task_done)
+
+
+def _background_task_done(task: asyncio.Task[None]) -> None:
+    background_tasks.discard(task)
+    # Nobody awaits these tasks, so log failures here instead of losing them until garbage collection
+    if not task.cancelled() and (exc := task.exception()) is not None:
+        logger.error("Background task %s failed", task.get_name(), exc_info=exc)
+
+
+def load_voice_engine(model: str) -> piper.PiperVoice:
+    """Load and warm up the voice engine; blocking, meant to run in a worker thread."""
+    voice_engine = init_voice.initialize_voice_engine(model)
+    init_voice.warm_up_voice_engine(voice_engine)
+    return voice_engine
+
+
+# espeak-ng keeps global state, so phonemization must not run on several threads at once.
+_phonemize_lock = threading.Lock()
+
+
+def iter_audio_chunks(voice_engine: piper.PiperVoice, text: str) -> Iterator[bytes]:
+    """Yield raw int16 audio per sentence, mirroring PiperVoice.synthesize_stream_raw.
+
+    Only phonemization is serialized; ONNX Runtime inference releases the GIL and runs concurrently.
+    """
+    with _phonemize_lock:
+        sentence_phonemes = voice_engine.phonemize(text)
+    for phonemes in sentence_phonemes:
+        yield voice_engine.synthesize_ids_to_raw(voice_engine.phonemes_to_ids(phonemes))
+
+
+def next_audio_chunk(audio_chunks: Iterator[bytes]) -> bytes | None:
+    """Advance the blocking synthesis iterator by one sentence; None once it is exhausted."""
+    return next(audio_chunks, None)
+
+
+async def run_synthesis(
+    job: SynthesisJob, voice_engine: piper.PiperVoice, text: str, tts_cache: TTSCache, executor: ThreadPoolExecutor
+) -> None:
+    """Synthesize text on the executor, publishing each sentence to the job, then cache the full utterance.
+
+    Runs independently of any response, so synthesis finishes and is cached even if the requesting client
+    disconnects; requests for the same text join the job until it has been cached.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+        audio_chunks = iter_audio_chunks(voice_engine, text)
+        while (audio_chunk := await loop.run_in_executor(executor, next_audio_chunk, audio_chunks)) is not None:
+            await job.publish(audio_chunk)
+    except Exception as exc:
+        logger.exception("Synthesis failed for text: %s", text[:50])
+        remember_failed_synthesis(text)
+        await job.finish(exc)
+        inflight_syntheses.pop(text, None)
+        return
+    await job.finish()
+    try:
+        await tts_cache.set(text, b"".join(job.chunks))
+    finally:
+        inflight_syntheses.pop(text, None)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):  # noqa: ARG001
-    global ml_models, cache
+    global ml_models, cache, synthesis_executor, allowed_user_token
 
-    ml_models["voice_engine"] = init_voice.initialize_voice_engine(
-        os.getenv("TTS_MODEL", "en_US-kathleen-low.onnx"),
+    # Read once at startup rather than through os.environ on every request
+    token = os.getenv("ALLOWED_USER_TOKEN")
+    if token is None:
+        logger.warning("ALLOWED_USER_TOKEN is not set; all synthesis requests will be rejected.")
+    allowed_user_token = token.encode() if token is not None else None
+
+    # Load the model in a worker thread so cache setup proceeds while ONNX Runtime initializes.
+    voice_engine_task = asyncio.create_task(
+        asyncio.to_thread(load_voice_engine, os.getenv("TTS_MODEL", "en_US-kathleen-low.onnx"))
     )
     redis_pw = os.getenv("REDIS_PASSWORD")
     redis_url = "redis://"
@@ -88,22 +489,47 @@ async def lifespan(app: FastAPI):  # noqa: ARG001
         config=CacheConfig(
             enabled=os.getenv("ENABLE_CACHE", "true").lower() == "true",
             ttl=int(os.getenv("CACHE_TTL", "604800")),
+            local_max=int(os.getenv("CACHE_LOCAL_MAX", "128")),
+            local_ttl=int(os.getenv("CACHE_LOCAL_TTL", "60")),
+            compression_level=int(os.getenv("CACHE_COMPRESSION_LEVEL", "3")),
+            pool_size=int(os.getenv("CACHE_POOL_SIZE", "16")),
+            pool_timeout=int(os.getenv("CACHE_POOL_TIMEOUT", "2")),
         ),
     )
+    await cache.connect()
+    # A dedicated pool keeps synthesis from competing with other threadpool work in Starlette
+    synthesis_executor = ThreadPoolExecutor(
+        max_workers=int(os.getenv("SYNTHESIS_WORKERS", str(os.cpu_count() or 1))),
+        thread_name_prefix="synthesis",
+    )
+    ml_models["voice_engine"] = await voice_engine_task
 
     yield
 
+    await asyncio.gather(*background_tasks, return_exceptions=True)
     if cache:
         await cache.close()
+    synthesis_executor.shutdown(cancel_futures=True)
     ml_models.clear()
 
 
 app = FastAPI(lifespan=lifespan)
+if os.getenv("ENABLE_RESPONSE_COMPRESSION", "false").lower() == "true":
+    # Opt-in per client via Accept-Encoding; trades CPU per response for a smaller transfer of the raw PCM.
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=1024,
+        compresslevel=int(os.getenv("RESPONSE_COMPRESSION_LEVEL", "3")),
+    )
+
+
+# Health probes hit this often; serve pre-encoded JSON instead of serializing a dict on every call
+HEALTH_RESPONSE_BODY = b'{"status":"healthy"}'
 
 
 @app.get("/health")
-async def health() -> dict[str, str]:
-    return {"status": "healthy"}
+async def health() -> responses.Response:
+    return responses.Response(content=HEALTH_RESPONSE_BODY, media_type="application/json")
 
 
 @app.post("/synthesizeSpeech")
@@ -111,11 +537,22 @@ async def synthesize_speech(
     synthesize_request: SynthesizeRequest,
     user_token: Annotated[str | None, Header()] = None,
 ) -> responses.Response:
-    if user_token != os.environ["ALLOWED_USER_TOKEN"]:
+    # Constant-time comparison so response timing does not reveal how much of the token matched
+    if (
+        user_token is None
+        or allowed_user_token is None
+        or not hmac.compare_digest(user_token.encode(), allowed_user_token)
+    ):
         raise HTTPException(status_code=403)
 
     if not cache:
         raise HTTPException(status_code=500, detail="Cache not initialized")
+    if not synthesis_executor:
+        raise HTTPException(status_code=500, detail="Synthesis executor not initialized")
+
+    # Failures after audio has started surface mid-stream; answer repeats of a failing text with a proper error
+    if synthesis_failed_recently(synthesize_request.text):
+        raise HTTPException(status_code=500, detail="Synthesis failed recently for this text")
 
     # Try to get from cache first
     cached_audio = await cache.get(synthesize_request.text)
@@ -126,18 +563,17 @@ async def synthesize_speech(
             headers={"Content-Length": str(len(cached_audio))},
         )
 
-    # If not in cache, generate new audio
-    voice_engine = ml_models["voice_engine"]
-    audio_stream = voice_engine.synthesize_stream_raw(synthesize_request.text)
-
-    # Convert stream to bytes for caching
-    audio_data = b"".join(list(audio_stream))
-
-    # Store in cache asynchronously
-    await cache.set(synthesize_request.text, audio_data)
-
-    return responses.Response(
-        content=audio_data,
-        media_type="audio/x-raw",
-        headers={"Content-Length": str(len(audio_data))},
-    )
+    # If not in cache, stream audio to the client as it is generated, joining a running synthesis if any
+    job = inflight_syntheses.get(synthesize_request.text)
+    if job is None:
+        job = SynthesisJob()
+        inflight_syntheses[synthesize_request.text] = job
+        run_in_background(
+            run_synthesis(job, ml_models["voice_engine"], synthesize_request.text, cache, synthesis_executor)
+        )
+    # The status line goes out before the first chunk, so only start streaming once audio is being produced
+    try:
+        await job.started()
+    except Exception:
+        raise HTTPException(status_code=500, detail="Synthesis failed") from None
+    return responses.StreamingResponse(job.stream(), media_type="audio/x-raw")
@@ -0,0 +1,70 @@
+import http.client
+import urllib.request
+
+from app import download_voice
+
+DATA = bytes(range(256)) * 40
+VOICES_INFO = {"voice": {"files": {"en/voice/voice.onnx": {"size_bytes": len(DATA)}}}}
+
+
+class FakeResponse:
+    def __init__(self, status: int, body: bytes, incomplete: bool) -> None:
+        self.status = status
+        self.body = body
+        self.incomplete = incomplete
+
+    def __enter__(self) -> "FakeResponse":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def read(self, size: int) -> bytes:
+        chunk, self.body = self.body[:size], self.body[size:]
+        if not chunk and self.incomplete:
+            raise http.client.IncompleteRead(b"", size)
+        return chunk
+
+
+def fake_server(
+    monkeypatch, status: int = 206, truncate: bool = False, incomplete_read: bool = True
+) -> list[tuple[int, int]]:
+    """Serve DATA from a patched urlopen, recording the requested byte ranges."""
+    requested: list[tuple[int, int]] = []
+
+    def urlopen(request: urllib.request.Request, timeout: float) -> FakeResponse:  # noqa: ARG001
+        start, end = map(int, str(request.get_header("Range")).removeprefix("bytes=").split("-"))
+        requested.append((start, end))
+        body = DATA[start : end + 1] if status == 206 else DATA
+        if truncate:
+            body = body[: len(body) // 2]
+        return FakeResponse(status, body, incomplete=truncate and incomplete_read)
+
+    monkeypatch.setattr(download_voice.urllib.request, "urlopen", urlopen)
+    return requested
+
+
+def test_download_in_ranges_assembles_all_parts(monkeypatch, tmp_path):
+    requested = fake_server(monkeypatch)
+    target = tmp_path / "voice.onnx"
+    download_voice.download_in_ranges("https://example.com/voice.onnx", target, len(DATA), parts=4)
+    assert target.read_bytes() == DATA
+    assert sorted(requested) == [(0, 2559), (2560, 5119), (5120, 7679), (7680, 10239)]
+
+
+def test_prefetch_falls_back_when_ranges_are_not_honoured(monkeypatch, tmp_path):
+    fake_server(monkeypatch, status=200)
+    download_voice.prefetch_model_weights("voice", VOICES_INFO, tmp_path)
+    assert not (tmp_path / "voice.onnx").exists()
+
+
+def test_prefetch_falls_back_on_truncated_range_body(monkeypatch, tmp_path):
+    fake_server(monkeypatch, truncate=True)
+    download_voice.prefetch_model_weights("voice", VOICES_INFO, tmp_path)
+    assert not (tmp_path / "voice.onnx").exists()
+
+
+def test_prefetch_falls_back_on_short_range_body(monkeypatch, tmp_path):
+    fake_server(monkeypatch, truncate=True, incomplete_read=False)
+    download_voice.prefetch_model_weights("voice", VOICES_INFO, tmp_path)
+    assert not (tmp_path / "voice.onnx").exists()
@@ -0,0 +1,143 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import HTTPException, responses
+
+from app import main
+from app.main import SynthesisJob, SynthesizeRequest
+
+
+async def collect(job: SynthesisJob) -> list[bytes]:
+    return [chunk async for chunk in job.stream()]
+
+
+def test_all_consumers_receive_every_chunk():
+    async def scenario():
+        job = SynthesisJob()
+        early = asyncio.create_task(collect(job))
+        await job.publish(b"one")
+        await asyncio.sleep(0)
+        late = asyncio.create_task(collect(job))
+        await job.publish(b"two")
+        await job.finish()
+        return await early, await late
+
+    assert asyncio.run(scenario()) == ([b"one", b"two"], [b"one", b"two"])
+
+
+def test_consumers_see_synthesis_errors():
+    async def scenario():
+        job = SynthesisJob()
+        await job.publish(b"one")
+        await job.finish(RuntimeError("boom"))
+        return await collect(job)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(scenario())
+
+
+def test_failed_synthesis_is_rejected_until_retry_window_passes(monkeypatch):
+    monkeypatch.setattr(main, "failed_syntheses", OrderedDict())
+    main.remember_failed_synthesis("Hello!")
+    assert main.synthesis_failed_recently("Hello!")
+    assert not main.synthesis_failed_recently("Other")
+
+    main.failed_syntheses["Hello!"] = time.monotonic() - 1
+    assert not main.synthesis_failed_recently("Hello!")
+    assert "Hello!" not in main.failed_syntheses
+
+
+class FakeCache:
+    def __init__(self) -> None:
+        self.stored: dict[str, bytes] = {}
+
+    async def get(self, text: str, voice_id: str = "default") -> bytes | None:  # noqa: ARG002
+        return self.stored.get(text)
+
+    async def set(self, text: str, audio_data: bytes, voice_id: str = "default") -> None:  # noqa: ARG002
+        self.stored[text] = audio_data
+
+
+def use_fake_service(monkeypatch, executor: ThreadPoolExecutor) -> FakeCache:
+    fake_cache = FakeCache()
+    monkeypatch.setattr(main, "inflight_syntheses", {})
+    monkeypatch.setattr(main, "failed_syntheses", OrderedDict())
+    monkeypatch.setattr(main, "background_tasks", set())
+    monkeypatch.setattr(main, "allowed_user_token", b"token")
+    monkeypatch.setattr(main, "cache", fake_cache)
+    monkeypatch.setattr(main, "synthesis_executor", executor)
+    monkeypatch.setattr(main, "ml_models", {"voice_engine": object()})
+    return fake_cache
+
+
+async def request_audio(text: str) -> bytes:
+    response = await main.synthesize_speech(SynthesizeRequest(text=text), user_token="token")
+    assert isinstance(response, responses.StreamingResponse)
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+def test_started_raises_errors_before_the_first_chunk_only():
+    async def scenario():
+        failed = SynthesisJob()
+        await failed.finish(RuntimeError("boom"))
+        with pytest.raises(RuntimeError, match="boom"):
+            await failed.started()
+
+        interrupted = SynthesisJob()
+        await interrupted.publish(b"one")
+        await interrupted.finish(RuntimeError("boom"))
+        await interrupted.started()
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_misses_share_one_synthesis(monkeypatch):
+    piper_runs: list[str] = []
+
+    def fake_audio_chunks(voice_engine: object, text: str) -> Iterator[bytes]:  # noqa: ARG001
+        piper_runs.append(text)
+        yield b"one"
+        yield b"two"
+
+    monkeypatch.setattr(main, "iter_audio_chunks", fake_audio_chunks)
+
+    async def scenario():
+        audio = await asyncio.gather(request_audio("Hello!"), request_audio("Hello!"))
+        await asyncio.gather(*main.background_tasks)
+        return audio
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        fake_cache = use_fake_service(monkeypatch, executor)
+        assert asyncio.run(scenario()) == [b"onetwo", b"onetwo"]
+
+    assert piper_runs == ["Hello!"]
+    assert fake_cache.stored == {"Hello!": b"onetwo"}
+    assert not main.inflight_syntheses
+
+
+def test_failed_synthesis_is_removed_from_inflight(monkeypatch):
+    def failing_audio_chunks(voice_engine: object, text: str) -> Iterator[bytes]:  # noqa: ARG001
+        raise RuntimeError("boom")
+        yield b""
+
+    monkeypatch.setattr(main, "iter_audio_chunks", failing_audio_chunks)
+
+    async def scenario():
+        with pytest.raises(HTTPException) as first_error:
+            await request_audio("Hello!")
+        await asyncio.gather(*main.background_tasks)
+        with pytest.raises(HTTPException) as repeat_error:
+            await request_audio("Hello!")
+        return first_error.value.status_code, repeat_error.value.status_code
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        fake_cache = use_fake_service(monkeypatch, executor)
+        assert asyncio.run(scenario()) == (500, 500)
+
+    assert not main.inflight_syntheses
+    assert main.synthesis_failed_recently("Hello!")
+    assert not fake_cache.stored
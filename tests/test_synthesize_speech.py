@@ -24,3 +24,30 @@ def test_synthesize_speech():
             json={"samplerate": 16000, "text": "Hello!"},
         )
         assert response.status_code == 200, "HTTP Code should be 200"
+
+
+def test_synthesize_speech_rejects_wrong_token():
+    with TestClient(main.app) as client:
+        response = client.post(
+            "/synthesizeSpeech",
+            headers={"user-token": "WRONG"},
+            json={"text": "Hello!"},
+        )
+        assert response.status_code == 403, "HTTP Code should be 403"
+
+
+def test_synthesize_speech_rejects_missing_token():
+    with TestClient(main.app) as client:
+        response = client.post("/synthesizeSpeech", json={"text": "Hello!"})
+        assert response.status_code == 403, "HTTP Code should be 403"
+
+
+def test_synthesize_speech_rejects_all_tokens_when_unset():
+    os.environ.pop("ALLOWED_USER_TOKEN", None)
+    with TestClient(main.app) as client:
+        response = client.post(
+            "/synthesizeSpeech",
+            headers={"user-token": "DEBUG"},
+            json={"text": "Hello!"},
+        )
+        assert response.status_code == 403, "HTTP Code should be 403"
@@ -0,0 +1,208 @@
+import asyncio
+import base64
+import hashlib
+import zlib
+
+from redis.exceptions import RedisError
+
+from app.main import CACHE_FORMAT_ZLIB, CacheConfig, RedisBatcher, TTSCache, jittered_ttl
+
+
+def make_cache(**config) -> TTSCache:
+    return TTSCache(redis_url="redis://localhost:6379", config=CacheConfig(**config))
+
+
+def test_cache_key_is_deterministic():
+    cache = make_cache()
+    assert cache._generate_cache_key("Hello!") == cache._generate_cache_key("Hello!")
+
+
+def test_cache_key_depends_on_voice_and_text():
+    cache = make_cache()
+    key = cache._generate_cache_key("Hello!")
+    assert key != cache._generate_cache_key("Hello?")
+    assert key != cache._generate_cache_key("Hello!", voice_id="other")
+
+
+def test_cache_key_format():
+    key = make_cache()._generate_cache_key("Hello!")
+    assert key.startswith("tts:")
+    assert len(key) == len("tts:") + 22
+
+
+def test_cache_key_matches_single_pass_digest():
+    key = make_cache()._generate_cache_key("Hello!", voice_id="voice")
+    digest = hashlib.blake2b(b"voice:Hello!", digest_size=16).digest()
+    assert key == f"tts:{base64.urlsafe_b64encode(digest).rstrip(b'=').decode()}"
+
+
+def test_get_serves_local_cache_without_redis():
+    cache = make_cache()
+    cache._store_local(cache._generate_cache_key("Hello!"), b"audio")
+    assert asyncio.run(cache.get("Hello!")) == b"audio"
+
+
+def test_local_cache_evicts_least_recently_used():
+    cache = make_cache(local_max=2)
+    cache._store_local("a", b"1")
+    cache._store_local("b", b"2")
+    cache._local_cache.move_to_end("a")
+    cache._store_local("c", b"3")
+    assert list(cache._local_cache) == ["a", "c"]
+
+
+def test_local_cache_can_be_disabled():
+    cache = make_cache(local_max=0)
+    cache._store_local("a", b"1")
+    assert not cache._local_cache
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis") -> None:
+        self.redis = redis
+        self.commands: list[tuple[str, str]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    def get(self, key: str) -> "FakePipeline":
+        self.commands.append(("get", key))
+        return self
+
+    def expire(self, key: str, ttl: int) -> "FakePipeline":
+        self.redis.refreshed_ttls.append(ttl)
+        self.commands.append(("expire", key))
+        return self
+
+    def setex(self, key: str, ttl: int, value: bytes) -> "FakePipeline":  # noqa: ARG002
+        self.redis.data[key] = value
+        self.commands.append(("setex", key))
+        return self
+
+    async def execute(self) -> list:
+        self.redis.executions += 1
+        return [self.redis.data.get(key) if command == "get" else True for command, key in self.commands]
+
+
+class FakeRedis:
+    def __init__(self, data: dict[str, bytes]) -> None:
+        self.data = data
+        self.executions = 0
+        self.refreshed_ttls: list[int] = []
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:  # noqa: ARG002
+        return FakePipeline(self)
+
+
+def test_batcher_coalesces_concurrent_reads():
+    redis = FakeRedis({"a": b"1", "b": b"2"})
+    batcher = RedisBatcher(redis, ttl=60)  # type: ignore[arg-type]
+
+    async def read_all():
+        return await asyncio.gather(batcher.get("a"), batcher.get("b"), batcher.get("a"), batcher.get("missing"))
+
+    assert asyncio.run(read_all()) == [b"1", b"2", b"1", None]
+    assert redis.executions == 1
+
+
+def test_batcher_refreshes_reads_with_jittered_ttl():
+    redis = FakeRedis({})
+    batcher = RedisBatcher(redis, ttl=1000, ttl_jitter=0.1)  # type: ignore[arg-type]
+
+    async def read_all():
+        await asyncio.gather(*(batcher.get(str(i)) for i in range(50)))
+
+    asyncio.run(read_all())
+    assert all(900 <= ttl <= 1100 for ttl in redis.refreshed_ttls)
+    assert len(set(redis.refreshed_ttls)) > 1
+
+
+def test_jittered_ttl_stays_within_bounds():
+    assert all(90 <= jittered_ttl(100, 0.1) <= 110 for _ in range(100))
+    assert jittered_ttl(100, 0.0) == 100
+
+
+def test_local_cache_entries_expire():
+    cache = make_cache(local_ttl=0)
+    cache._store_local("a", b"1")
+    assert cache._get_local("a") is None
+    assert not cache._local_cache
+
+
+def test_batcher_coalesces_writes_within_window():
+    redis = FakeRedis({})
+    batcher = RedisBatcher(redis, ttl=60)  # type: ignore[arg-type]
+
+    async def write_all():
+        await asyncio.gather(batcher.setex("a", 60, b"1"), batcher.setex("b", 60, b"2"))
+
+    asyncio.run(write_all())
+    assert redis.data == {"a": b"1", "b": b"2"}
+    assert redis.executions == 1
+
+
+def test_batcher_flushes_full_write_batch_immediately():
+    redis = FakeRedis({})
+    batcher = RedisBatcher(redis, ttl=60, write_delay=60, max_writes=2)  # type: ignore[arg-type]
+
+    async def write_all():
+        await asyncio.gather(batcher.setex("a", 60, b"1"), batcher.setex("b", 60, b"2"))
+
+    asyncio.run(asyncio.wait_for(write_all(), timeout=1))
+    assert redis.executions == 1
+
+
+def test_decode_stored_entries():
+    cache = make_cache()
+    assert cache._decode("key", CACHE_FORMAT_ZLIB + zlib.compress(b"audio")) == b"audio"
+    assert cache._decode("key", b"\x7f" + zlib.compress(b"audio")) is None
+    assert cache._decode("key", CACHE_FORMAT_ZLIB + b"corrupt") is None
+
+
+class FailingBatcher:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def get(self, key: str) -> bytes | None:  # noqa: ARG002
+        self.calls += 1
+        raise RedisError("connection refused")
+
+
+def test_redis_errors_are_misses_and_trip_the_breaker():
+    cache = make_cache(breaker_threshold=2)
+    batcher = FailingBatcher()
+    cache.batcher = batcher  # type: ignore[assignment]
+
+    async def lookups():
+        return [await cache.get("Hello!") for _ in range(3)]
+
+    assert asyncio.run(lookups()) == [None, None, None]
+    assert batcher.calls == 2
+
+
+class BrokenPipeline(FakePipeline):
+    async def execute(self) -> list:
+        self.redis.executions += 1
+        raise RedisError("connection reset")
+
+
+class BrokenRedis(FakeRedis):
+    def pipeline(self, transaction: bool = True) -> FakePipeline:  # noqa: ARG002
+        return BrokenPipeline(self)
+
+
+def test_failed_batch_counts_as_one_breaker_failure():
+    cache = make_cache(breaker_threshold=2)
+    redis = BrokenRedis({})
+    cache.batcher = RedisBatcher(redis, ttl=60)  # type: ignore[arg-type]
+
+    async def concurrent_lookups():
+        return await asyncio.gather(*(cache.get(f"Hello {i}!") for i in range(3)))
+
+    assert asyncio.run(concurrent_lookups()) == [None, None, None]
+    assert redis.executions == 1
+    assert cache._consecutive_failures == 1
+    assert not cache._bypassed()